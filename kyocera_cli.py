@@ -6,30 +6,109 @@ status for a configured organization/site.
 from __future__ import annotations
 
 import argparse
-import configparser
 import csv
+from bisect import bisect_left, bisect_right
 import logging
 import json
+import os
+import pickle
 import sys
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from html.parser import HTMLParser
-from http.cookiejar import Cookie, CookieJar
 from pathlib import Path
 import re
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-from urllib.parse import urljoin, urlencode
-import urllib.error
-import urllib.parse
-import urllib.request
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    # Optional: C-accelerated JSON parsing for the realtime payload.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
 
 BASE_URL = "https://sr.en.kyocera-solar.jp"
 DEFAULT_CONFIG = Path("kyocera.conf")
-CACHE_PATH = Path.home() / ".cache" / "kyocera-solar" / "session.json"
+CACHE_PATH = Path.home() / ".cache" / "kyocera-solar" / "session.pickle"
 SESSION_MAX_AGE = 60 * 30  # seconds
+CACHE_VERSION = 3  # bump when the session cache layout changes
 USER_AGENT = "KyoceraSolarCLI/0.1 (+https://github.com/CodexUser)"
 
+# Compiled once: matched against every signage/login response.
+_CSRF_RE = re.compile(r'<meta\s+name="csrf-token"\s+content="([^"]+)"', re.IGNORECASE)
+
+# Login-form extraction. The portal's login page is a stable Rails form, so a
+# couple of targeted regexes beat tokenising the whole page with HTMLParser.
+_FORM_RE = re.compile(r'<form\b([^>]*method=["\']post["\'][^>]*)>(.*?)</form>', re.IGNORECASE | re.DOTALL)
+_INPUT_RE = re.compile(r"<input\b([^>]*)>", re.IGNORECASE)
+_ATTR_RE = re.compile(r'(\w+)\s*=\s*"([^"]*)"')
+
+# Minimal INI syntax for the fixed-shape kyocera.conf; configparser would add
+# tens of ms of import and parse overhead on every cold start.
+_SECTION_RE = re.compile(r"^\s*\[([^\]]+)\]\s*$")
+_KV_RE = re.compile(r"^\s*([^=;#\s][^=]*?)\s*=\s*(.*?)\s*$")
+
+# ANSI palette and emoji maps, built once: render_status runs every tick in
+# watch mode.
+_RESET = "\033[0m"
+_BOLD = "\033[1m"
+_YELLOW = "\033[93m"
+_GREEN = "\033[92m"
+_BLUE = "\033[94m"
+_CYAN = "\033[96m"
+_RED = "\033[91m"
+_ORANGE = "\033[38;5;208m"
+_GRAY = "\033[90m"
+
+_WEATHER_ICON_MAP = {
+    "sunny": "☀️",
+    "clear": "☀️",
+    "cloudy": "☁️",
+    "partly_cloudy": "⛅",
+    "rainy": "🌧️",
+    "rain": "🌧️",
+    "snow": "🌨️",
+    "storm": "⛈️",
+    "thunderstorm": "⛈️",
+    "fog": "🌫️",
+    "mist": "🌫️",
+}
+
+# All 11 fill states of the 10-char progress bars, so render_status indexes
+# instead of re-concatenating "█"/"░" runs every tick.
+_BAR_SOLID = tuple("█" * i for i in range(11))
+_BAR_EMPTY = tuple("░" * (10 - i) for i in range(11))
+
+# Ascending threshold tables so bisect picks the style row directly.
+_CLEAN_KEYS = (50, 75)  # % clean energy: below 50 ⚡, 50-74 ♻️, 75+ 🌱
+_CLEAN_STYLES = ((_ORANGE, "⚡"), (_YELLOW, "♻️"), (_GREEN, "🌱"))
+_BATTERY_KEYS = (30, 60)  # % charge: ≤30 red, ≤60 yellow, above green
+_BATTERY_COLORS = (_RED, _YELLOW, _GREEN)
+
+
+def _parse_ini(path: Path) -> Dict[str, Dict[str, str]]:
+    """Tiny INI reader: sections of key = value pairs, # or ; comments."""
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith(("#", ";")):
+            continue
+        section_match = _SECTION_RE.match(line)
+        if section_match:
+            current = sections.setdefault(section_match.group(1).strip(), {})
+            continue
+        kv_match = _KV_RE.match(line)
+        if kv_match and current is not None:
+            current[kv_match.group(1)] = kv_match.group(2)
+    return sections
+
 
 class KyoceraError(RuntimeError):
     """Base error for CLI failures."""
@@ -52,40 +131,6 @@ class KyoceraHTTPError(KyoceraError):
         super().__init__(f"HTTP {status_code}")
 
 
-class LoginFormParser(HTMLParser):
-    """Captures POST forms and csrf token for the login page."""
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.forms: List[Dict[str, Any]] = []
-        self._current_form: Optional[Dict[str, Any]] = None
-        self.csrf_token: Optional[str] = None
-
-    def handle_starttag(self, tag: str, attrs: Iterable[Tuple[str, Optional[str]]]) -> None:
-        attr_dict = {k: (v or "") for k, v in attrs}
-        if tag == "meta" and attr_dict.get("name") == "csrf-token":
-            self.csrf_token = attr_dict.get("content")
-            return
-
-        if tag == "form":
-            method = attr_dict.get("method", "get").lower()
-            self._current_form = {"method": method, "action": attr_dict.get("action"), "fields": {}}
-            self.forms.append(self._current_form)
-            return
-
-        if tag == "input" and self._current_form:
-            name = attr_dict.get("name")
-            if not name:
-                return
-            if attr_dict.get("type") in {"submit", "button"}:
-                return
-            self._current_form["fields"][name] = attr_dict.get("value", "")
-
-    def handle_endtag(self, tag: str) -> None:
-        if tag == "form" and self._current_form:
-            self._current_form = None
-
-
 @dataclass
 class KyoceraConfig:
     email: str
@@ -100,43 +145,45 @@ class KyoceraConfig:
 
     @classmethod
     def load(cls, path: Path) -> "KyoceraConfig":
-        cp = configparser.ConfigParser()
-        read_files = cp.read(path)
-        if not read_files:
+        try:
+            cfg = _parse_ini(path)
+        except OSError as exc:
+            raise KyoceraError(f"Could not read configuration file at {path}") from exc
+        if not cfg:
             raise KyoceraError(f"Could not read configuration file at {path}")
 
         try:
-            email = cp["auth"]["email"].strip()
-            password = cp["auth"]["password"].strip()
+            email = cfg["auth"]["email"].strip()
+            password = cfg["auth"]["password"].strip()
         except KeyError as exc:
             raise KyoceraError("Missing [auth] section with email/password") from exc
 
         try:
-            organization_id = cp["site"]["organization_id"].strip()
-            site_id = cp["site"]["site_id"].strip()
+            organization_id = cfg["site"]["organization_id"].strip()
+            site_id = cfg["site"]["site_id"].strip()
         except KeyError as exc:
             raise KyoceraError("Missing [site] section with organization_id/site_id") from exc
 
-        base_url = cp["site"].get("base_url", BASE_URL).strip() or BASE_URL
-        location = cp["site"].get("location", "Japan").strip() or "Japan"
+        base_url = cfg["site"].get("base_url", BASE_URL).strip() or BASE_URL
+        location = cfg["site"].get("location", "Japan").strip() or "Japan"
 
         # Battery settings (optional)
         battery_capacity_kwh = 7.0
         battery_reserve_percent = 30
-        if "battery" in cp:
+        if "battery" in cfg:
             try:
-                battery_capacity_kwh = float(cp["battery"].get("capacity_kwh", "7.0"))
+                battery_capacity_kwh = float(cfg["battery"].get("capacity_kwh", "7.0"))
             except ValueError:
                 pass
             try:
-                battery_reserve_percent = int(cp["battery"].get("reserve_percent", "30"))
+                battery_reserve_percent = int(cfg["battery"].get("reserve_percent", "30"))
             except ValueError:
                 pass
 
         # Logging settings (optional)
         log_dir = None
-        if "logging" in cp:
-            log_dir_str = cp["logging"].get("log_dir", "").strip()
+        if "logging" in cfg:
+            log_dir_str = cfg["logging"].get("log_dir", "").strip()
             if log_dir_str:
                 log_dir = Path(log_dir_str)
 
@@ -373,22 +420,41 @@ class KyoceraClient:
 
     def __init__(self, config: KyoceraConfig, cache_path: Path = CACHE_PATH, disable_cache: bool = False) -> None:
         self.config = config
-        self.cookie_jar: CookieJar = CookieJar()
-        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookie_jar))
-        self.default_headers = {
-            "User-Agent": USER_AGENT,
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "Connection": "keep-alive",
-        }
+        self.session = requests.Session()
+        # No explicit Accept-Encoding needed: requests advertises gzip/deflate
+        # (plus Brotli when the optional `brotli` package is installed) and
+        # decompresses transparently, so signage HTML and realtime JSON travel
+        # compressed on the wire.
+        self.session.headers.update(
+            {
+                "User-Agent": USER_AGENT,
+                "Accept-Language": "en-US,en;q=0.9",
+                "Accept": "application/json, text/javascript, */*; q=0.01",
+                "Connection": "keep-alive",
+            }
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.cache_path = cache_path
         self.disable_cache = disable_cache
+        self._cookies_dirty = False
         self.csrf_token: Optional[str] = None
         self._signage_ready = False
+        # urljoin parses both URLs each call, so build the fixed endpoints once.
         self._signage_url = urljoin(
             self.config.base_url,
             f"/organizations/{self.config.organization_id}/sites/{self.config.site_id}/signage",
         )
+        self._realtime_url = urljoin(
+            self.config.base_url,
+            f"/organizations/{self.config.organization_id}/sites/{self.config.site_id}/realtime",
+        )
+        self._login_url = urljoin(self.config.base_url, "/login")
         if not disable_cache:
             self._load_session_cache()
 
@@ -400,19 +466,22 @@ class KyoceraClient:
         self._cleanup_old_cache()
 
         try:
-            with self.cache_path.open("r", encoding="utf-8") as file_handle:
-                payload = json.load(file_handle)
-            timestamp = payload.get("timestamp", 0)
-            if time.time() - timestamp > SESSION_MAX_AGE:
+            with self.cache_path.open("rb") as file_handle:
+                payload = pickle.load(file_handle)
+            if payload.get("v") != CACHE_VERSION:
+                logging.debug("Session cache has an unknown format; ignoring it.")
+                return
+            if time.time() - payload.get("timestamp", 0) > SESSION_MAX_AGE:
                 logging.debug("Session cache expired.")
                 return
-            cookies = payload.get("cookies", [])
-            for cookie_dict in cookies:
-                cookie = self._cookie_from_dict(cookie_dict)
-                if cookie:
-                    self.cookie_jar.set_cookie(cookie)
-            if cookies:
-                logging.debug("Loaded %d cookies from cache.", len(cookies))
+            jar = payload.get("jar")
+            if jar is None:
+                return
+            # A dead cookie would only buy us a 401 and a re-login.
+            jar.clear_expired_cookies()
+            self.session.cookies.update(jar)
+            if len(jar):
+                logging.debug("Loaded %d cookies from cache.", len(jar))
         except Exception as exc:  # noqa: BLE001
             logging.debug("Failed to load cached session: %s", exc)
 
@@ -430,53 +499,53 @@ class KyoceraClient:
             logging.debug("Failed to cleanup old cache: %s", exc)
 
     def _persist_session(self) -> None:
-        if self.disable_cache:
+        if self.disable_cache or not self._cookies_dirty:
             return
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cookies = [self._cookie_to_dict(cookie) for cookie in self.cookie_jar]
-        payload = {"timestamp": time.time(), "cookies": cookies}
-        with self.cache_path.open("w", encoding="utf-8") as file_handle:
-            json.dump(payload, file_handle)
-
-    @staticmethod
-    def _cookie_to_dict(cookie: Cookie) -> Dict[str, Any]:
-        return {
-            "name": cookie.name,
-            "value": cookie.value,
-            "domain": cookie.domain,
-            "path": cookie.path,
-            "secure": cookie.secure,
-            "expires": cookie.expires,
-            "discard": cookie.discard,
-        }
+        # Pickle a pruned copy of the jar: every cookie attribute survives
+        # without per-field (de)serialisation, while transient or
+        # already-expired cookies are dropped as they would be invalid next
+        # run anyway.
+        jar = self.session.cookies.copy()
+        jar.clear_expired_cookies()
+        jar.clear_session_cookies()
+        payload = {"v": CACHE_VERSION, "timestamp": time.time(), "jar": jar}
+        # Write-then-rename so a Ctrl-C mid-write cannot leave a torn cache.
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with tmp_path.open("wb") as file_handle:
+            pickle.dump(payload, file_handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.cache_path)
+        self._cookies_dirty = False
+
+    def _request_raw(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Thin wrapper around the shared session that adds headers and error reporting.
 
-    @staticmethod
-    def _cookie_from_dict(data: Dict[str, Any]) -> Optional[Cookie]:
-        name = data.get("name")
-        if not name:
-            return None
-        value = data.get("value", "")
-        domain = data.get("domain", "")
-        path = data.get("path", "/")
-        return Cookie(
-            version=0,
-            name=name,
-            value=value,
-            port=None,
-            port_specified=False,
-            domain=domain,
-            domain_specified=bool(domain),
-            domain_initial_dot=domain.startswith("."),
-            path=path,
-            path_specified=True,
-            secure=data.get("secure", False),
-            expires=data.get("expires"),
-            discard=data.get("discard", False),
-            comment=None,
-            comment_url=None,
-            rest={},
-            rfc2109=False,
-        )
+        The session keeps the TCP/TLS connection alive between calls and its
+        adapter retries transient 502/503/504 responses with backoff.
+        """
+        try:
+            response = self.session.request(
+                method.upper(),
+                url,
+                params=params,
+                data=data,
+                headers=headers,
+                timeout=30,
+            )
+        except requests.RequestException as exc:
+            raise KyoceraError(f"Network error: {exc}") from exc
+
+        if response.status_code >= 400:
+            raise KyoceraHTTPError(response.status_code, response.text)
+        return response
 
     def _request(
         self,
@@ -486,76 +555,40 @@ class KyoceraClient:
         params: Optional[Dict[str, str]] = None,
         data: Optional[Dict[str, str]] = None,
         headers: Optional[Dict[str, str]] = None,
-        retries: int = 3,
     ) -> str:
-        """Thin wrapper around urllib that adds headers, query string, and error reporting."""
-        final_url = url
-        if params:
-            query = urlencode(params)
-            delimiter = "&" if "?" in final_url else "?"
-            final_url = f"{final_url}{delimiter}{query}"
-
-        request_headers = dict(self.default_headers)
-        if headers:
-            request_headers.update(headers)
-
-        body_bytes: Optional[bytes] = None
-        if data is not None:
-            body_bytes = urlencode(data).encode("utf-8")
-            request_headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
-
-        req = urllib.request.Request(final_url, data=body_bytes, headers=request_headers, method=method.upper())
-
-        last_error = None
-        for attempt in range(retries):
-            try:
-                with self.opener.open(req, timeout=30) as response:
-                    raw_body = response.read()
-                    charset = response.headers.get_content_charset() or "utf-8"
-                    return raw_body.decode(charset, errors="replace")
-            except urllib.error.HTTPError as exc:
-                try:
-                    charset = exc.headers.get_content_charset() or "utf-8"
-                except Exception:  # noqa: BLE001
-                    charset = "utf-8"
-                body = exc.read().decode(charset, errors="replace")
-                raise KyoceraHTTPError(exc.code, body) from exc
-            except urllib.error.URLError as exc:
-                last_error = exc
-                if attempt < retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    logging.debug("Request failed (attempt %d/%d), retrying in %ds: %s",
-                                  attempt + 1, retries, wait_time, exc.reason)
-                    time.sleep(wait_time)
-                    continue
-                raise KyoceraError(f"Network error after {retries} attempts: {exc.reason}") from exc
-
-        # Should not reach here, but just in case
-        raise KyoceraError(f"Request failed after {retries} attempts") from last_error
+        """Like _request_raw but returns the decoded response body."""
+        return self._request_raw(method, url, params=params, data=data, headers=headers).text
 
     def _download_login_form(self) -> Tuple[Dict[str, Any], Optional[str]]:
-        login_url = urljoin(self.config.base_url, "/login")
-        response_text = self._request("GET", login_url, headers={"Accept": "text/html"})
-        parser = LoginFormParser()
-        parser.feed(response_text)
-        parser.close()
-        if parser.csrf_token:
-            self.csrf_token = parser.csrf_token
+        response_text = self._request("GET", self._login_url, headers={"Accept": "text/html"})
+
+        csrf_match = _CSRF_RE.search(response_text)
+        csrf_token = csrf_match.group(1) if csrf_match else None
+        if csrf_token:
+            self.csrf_token = csrf_token
 
         chosen_form: Optional[Dict[str, Any]] = None
-        for form in parser.forms:
-            if form.get("method", "get").lower() != "post":
-                continue
-            fields = form.get("fields", {})
+        for form_match in _FORM_RE.finditer(response_text):
+            form_attrs = dict(_ATTR_RE.findall(form_match.group(1)))
+            fields: Dict[str, str] = {}
+            for input_match in _INPUT_RE.finditer(form_match.group(2)):
+                input_attrs = dict(_ATTR_RE.findall(input_match.group(1)))
+                name = input_attrs.get("name")
+                if not name:
+                    continue
+                if input_attrs.get("type") in {"submit", "button"}:
+                    continue
+                fields[name] = input_attrs.get("value", "")
+            form = {"action": form_attrs.get("action"), "fields": fields}
             if not chosen_form:
                 chosen_form = form
             if any("email" in key.lower() or "login" in key.lower() for key in fields):
                 action = form.get("action") or "/users/sign_in"
-                return {"action": action, "fields": fields}, parser.csrf_token
+                return {"action": action, "fields": fields}, csrf_token
 
         if chosen_form:
             action = chosen_form.get("action") or "/users/sign_in"
-            return {"action": action, "fields": chosen_form.get("fields", {})}, parser.csrf_token
+            return {"action": action, "fields": chosen_form.get("fields", {})}, csrf_token
 
         raise KyoceraLoginError("Could not locate login form on the Kyocera portal.")
 
@@ -587,16 +620,22 @@ class KyoceraClient:
         payload = self._build_login_payload(form["fields"])
         action_url = urljoin(self.config.base_url, form["action"])
 
-        headers = {"Referer": urljoin(self.config.base_url, "/login")}
+        headers = {"Referer": self._login_url}
         if csrf_token:
             headers["X-CSRF-Token"] = csrf_token
 
-        response_text = self._request("POST", action_url, data=payload, headers=headers)
-        if "Invalid" in response_text or "error_explanation" in response_text:
+        response = self._request_raw("POST", action_url, data=payload, headers=headers)
+        response_text = response.text
+        # The portal redirects on success and re-renders the login page (a
+        # plain 200, no redirect) on bad credentials, so the body only needs
+        # scanning in that rare failure case.
+        if not response.history and ("Invalid" in response_text or "error_explanation" in response_text):
             raise KyoceraLoginError("Portal reported invalid credentials.")
 
-        self._update_csrf_from_html(response_text)
-        self._signage_ready = False
+        # The login response is itself a signed-in page; when it carries a
+        # fresh CSRF token the multi-KB signage fetch can be skipped entirely.
+        self._signage_ready = self._update_csrf_from_html(response_text)
+        self._cookies_dirty = True
         self._persist_session()
 
     def _ensure_signage_ready(self) -> None:
@@ -614,17 +653,15 @@ class KyoceraClient:
         self._update_csrf_from_html(html)
         self._signage_ready = True
 
-    def _update_csrf_from_html(self, html: str) -> None:
-        match = re.search(r'<meta\s+name="csrf-token"\s+content="([^"]+)"', html, flags=re.IGNORECASE)
+    def _update_csrf_from_html(self, html: str) -> bool:
+        match = _CSRF_RE.search(html)
         if match:
             self.csrf_token = match.group(1)
+            return True
+        return False
 
     def fetch_realtime(self) -> Dict[str, Any]:
         self._ensure_signage_ready()
-        url = urljoin(
-            self.config.base_url,
-            f"/organizations/{self.config.organization_id}/sites/{self.config.site_id}/realtime",
-        )
         params = {"realtime": "true", "signage": "true"}
         headers = {
             "Referer": self._signage_url,
@@ -633,18 +670,23 @@ class KyoceraClient:
         if self.csrf_token:
             headers["X-CSRF-Token"] = self.csrf_token
         try:
-            response_text = self._request("GET", url, params=params, headers=headers)
+            response_bytes = self._request_raw("GET", self._realtime_url, params=params, headers=headers).content
         except KyoceraHTTPError as exc:
             if exc.status_code in {401, 403}:
                 raise KyoceraAuthRequired("Session expired or unauthorized.") from exc
             raise
 
-        response_trimmed = response_text.lstrip()
-        if response_trimmed.startswith("<"):
+        # Peek at the first non-whitespace byte; the HTML login redirect can be
+        # large and lstrip() would copy the whole body just to inspect it.
+        i = 0
+        n = len(response_bytes)
+        while i < n and response_bytes[i] in b" \t\r\n":
+            i += 1
+        if i < n and response_bytes[i : i + 1] == b"<":
             raise KyoceraAuthRequired("Received HTML instead of JSON; probably logged out.")
 
         try:
-            data = json.loads(response_text)
+            data = _loads(response_bytes)
         except json.JSONDecodeError as exc:
             raise KyoceraError(f"Failed to parse realtime payload: {exc}") from exc
 
@@ -674,17 +716,6 @@ def format_metric(block: Dict[str, Any], default: str = "n/a") -> str:
 
 
 def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
-    # ANSI color codes
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    YELLOW = "\033[93m"
-    GREEN = "\033[92m"
-    BLUE = "\033[94m"
-    CYAN = "\033[96m"
-    RED = "\033[91m"
-    ORANGE = "\033[38;5;208m"
-    GRAY = "\033[90m"
-
     clock = data.get("clock", {})
     consumed = data.get("consumed", {})
     pv = data.get("pv", {})
@@ -699,7 +730,6 @@ def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
     # Parse time for friendly display
     now = clock.get("now", "")
     try:
-        from datetime import datetime
         dt = datetime.fromisoformat(now.replace("+09:00", "+09:00"))
         time_str = dt.strftime("%I:%M %p").lstrip("0")
         date_str = dt.strftime("%A, %B %d")
@@ -710,15 +740,15 @@ def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
     lines = []
 
     # Header - Brand
-    lines.append(f"\n{BOLD}{CYAN}🌇 Kyocera Solar{RESET}")
+    lines.append(f"\n{_BOLD}{_CYAN}🌇 Kyocera Solar{_RESET}")
 
     # Date and time
-    lines.append(f"{GRAY}{date_str} · {time_str}{RESET}")
+    lines.append(f"{_GRAY}{date_str} · {time_str}{_RESET}")
 
     # System alerts (if any)
     status_msg = data.get("status", {}).get("message")
     if status_msg:
-        lines.append(f"{RED}⚠️  {status_msg}{RESET}")
+        lines.append(f"{_RED}⚠️  {status_msg}{_RESET}")
 
     # Weather in one line with location
     weather_parts = []
@@ -732,21 +762,7 @@ def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
             location = zone_name
 
         weather_icon = weather.get("weather_icon", "")
-        # Map weather icon to emoji
-        icon_map = {
-            "sunny": "☀️",
-            "clear": "☀️",
-            "cloudy": "☁️",
-            "partly_cloudy": "⛅",
-            "rainy": "🌧️",
-            "rain": "🌧️",
-            "snow": "🌨️",
-            "storm": "⛈️",
-            "thunderstorm": "⛈️",
-            "fog": "🌫️",
-            "mist": "🌫️"
-        }
-        weather_emoji = icon_map.get(weather_icon.lower(), "🌤️")
+        weather_emoji = _WEATHER_ICON_MAP.get(weather_icon.lower(), "🌤️")
 
     # Start with location
     weather_parts.append(location)
@@ -784,7 +800,7 @@ def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
 
     if weather_parts:
         weather_line = " · ".join(weather_parts)
-        lines.append(f"{GRAY}{weather_emoji}  {weather_line}{RESET}")
+        lines.append(f"{_GRAY}{weather_emoji}  {weather_line}{_RESET}")
 
     lines.append("")
 
@@ -796,17 +812,17 @@ def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
 
     # 1. Solar (always positive, no sign needed)
     if pv_val > 0:
-        lines.append(f"🔆 Solar           {YELLOW}{BOLD}{pv_val:>5.1f} kW{RESET}")
+        lines.append(f"🔆 Solar           {_YELLOW}{_BOLD}{pv_val:>5.1f} kW{_RESET}")
     else:
-        lines.append(f"🌙 Solar           {GRAY}{pv_val:>5.1f} kW{RESET}")
+        lines.append(f"🌙 Solar           {_GRAY}{pv_val:>5.1f} kW{_RESET}")
 
     # 2. Grid (- for import/taking, + for export/selling)
     if purchased_val > 0:
-        lines.append(f"⚡ Grid            {RED}{-purchased_val:>5.1f} kW{RESET}")
+        lines.append(f"⚡ Grid            {_RED}{-purchased_val:>5.1f} kW{_RESET}")
     elif sold_val > 0:
-        lines.append(f"⚡ Grid            {GREEN}{sold_val:>+5.1f} kW{RESET}")
+        lines.append(f"⚡ Grid            {_GREEN}{sold_val:>+5.1f} kW{_RESET}")
     else:
-        lines.append(f"⚡ Grid            {GRAY}{0.0:>5.1f} kW{RESET}")
+        lines.append(f"⚡ Grid            {_GRAY}{0.0:>5.1f} kW{_RESET}")
 
     # 3. Battery (- for discharge/taking, + for charge/storing)
     discharge_val = 0
@@ -819,25 +835,19 @@ def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
         if remaining is not None:
             # Simple battery bar with color
             bars = int(remaining / 10)
-            empty = 10 - bars
 
             # Color based on battery level
-            if remaining > 60:
-                bat_color = GREEN
-            elif remaining > 30:
-                bat_color = YELLOW
-            else:
-                bat_color = RED
+            bat_color = _BATTERY_COLORS[bisect_left(_BATTERY_KEYS, remaining)]
 
-            bar_str = bat_color + "█" * bars + GRAY + "░" * empty + RESET
+            bar_str = "".join((bat_color, _BAR_SOLID[bars], _GRAY, _BAR_EMPTY[bars], _RESET))
 
             # Battery power value and status (no sign if 0)
             if charge_val > 0:
-                bat_power = f"{GREEN}{charge_val:>+5.1f} kW{RESET}"
+                bat_power = f"{_GREEN}{charge_val:>+5.1f} kW{_RESET}"
             elif discharge_val > 0:
-                bat_power = f"{RED}{-discharge_val:>5.1f} kW{RESET}"
+                bat_power = f"{_RED}{-discharge_val:>5.1f} kW{_RESET}"
             else:
-                bat_power = f"{GRAY}{0.0:>5.1f} kW{RESET}"
+                bat_power = f"{_GRAY}{0.0:>5.1f} kW{_RESET}"
 
             # Calculate time remaining (charge to 100% or discharge to reserve)
             # Check charge first to match power display logic
@@ -849,10 +859,10 @@ def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
 
                 if hours_to_full >= 1:
                     hrs = int(round(hours_to_full))
-                    time_str = f" {GRAY}(~{hrs}h to 100%){RESET}"
+                    time_str = f" {_GRAY}(~{hrs}h to 100%){_RESET}"
                 else:
                     mins = int(hours_to_full * 60)
-                    time_str = f" {GRAY}({mins}m to 100%){RESET}"
+                    time_str = f" {_GRAY}({mins}m to 100%){_RESET}"
             elif discharge_val > 0.05 and remaining > config.battery_reserve_percent:  # Discharging
                 usable_pct = remaining - config.battery_reserve_percent  # Don't go below reserve
                 usable_kwh = (usable_pct / 100) * config.battery_capacity_kwh
@@ -862,16 +872,16 @@ def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
                     hrs = int(hours_remaining)
                     mins = int((hours_remaining - hrs) * 60)
                     if mins > 0:
-                        time_str = f" {GRAY}({hrs}h{mins:02d}m){RESET}"
+                        time_str = f" {_GRAY}({hrs}h{mins:02d}m){_RESET}"
                     else:
-                        time_str = f" {GRAY}({hrs}h){RESET}"
+                        time_str = f" {_GRAY}({hrs}h){_RESET}"
                 else:
                     mins = int(hours_remaining * 60)
-                    time_str = f" {GRAY}({mins}m){RESET}"
+                    time_str = f" {_GRAY}({mins}m){_RESET}"
 
             # Choose battery emoji based on charge level
             battery_emoji = "🪫" if remaining <= 30 else "🔋"
-            lines.append(f"{battery_emoji} Battery         {bat_power}  [{bar_str}] {bat_color}{remaining:3.0f}%{RESET}{time_str}")
+            lines.append(f"{battery_emoji} Battery         {bat_power}  [{bar_str}] {bat_color}{remaining:3.0f}%{_RESET}{time_str}")
 
     # 4. Home with Clean energy percentage on same line
     if consumed_val > 0:
@@ -880,38 +890,26 @@ def render_status(data: Dict[str, Any], config: KyoceraConfig) -> str:
         clean_pct = min((clean_energy / consumed_val) * 100, 100)
 
         # Color based on clean percentage
-        if clean_pct >= 100:
-            clean_color = GREEN
-            clean_icon = "🌱"
-        elif clean_pct >= 75:
-            clean_color = GREEN
-            clean_icon = "🌱"
-        elif clean_pct >= 50:
-            clean_color = YELLOW
-            clean_icon = "♻️"
-        else:
-            clean_color = ORANGE
-            clean_icon = "⚡"
+        clean_color, clean_icon = _CLEAN_STYLES[bisect_right(_CLEAN_KEYS, clean_pct)]
 
         # Progress bar for clean energy
         clean_bars = int(clean_pct / 10)
-        clean_empty = 10 - clean_bars
-        clean_bar_str = clean_color + "█" * clean_bars + GRAY + "░" * clean_empty + RESET
+        clean_bar_str = "".join((clean_color, _BAR_SOLID[clean_bars], _GRAY, _BAR_EMPTY[clean_bars], _RESET))
 
-        lines.append(f"🏡 Home            {CYAN}{consumed_val:>5.1f} kW{RESET}  [{clean_bar_str}] {clean_color}{clean_pct:3.0f}%{RESET} {clean_icon}")
+        lines.append(f"🏡 Home            {_CYAN}{consumed_val:>5.1f} kW{_RESET}  [{clean_bar_str}] {clean_color}{clean_pct:3.0f}%{_RESET} {clean_icon}")
     else:
-        lines.append(f"🏡 Home            {CYAN}{consumed_val:>5.1f} kW{RESET}")
+        lines.append(f"🏡 Home            {_CYAN}{consumed_val:>5.1f} kW{_RESET}")
 
     lines.append("")
 
     # Lifetime summary
     gen_val = gentotal.get("value", 0) or 0
     co2_val = reduced.get("value", 0) or 0
-    lines.append(f"{GRAY}Lifetime: {gen_val:.1f} kWh generated · {co2_val:.2f} kg CO₂ saved{RESET}")
+    lines.append(f"{_GRAY}Lifetime: {gen_val:.1f} kWh generated · {co2_val:.2f} kg CO₂ saved{_RESET}")
 
     # Battery capacity info
     usable_capacity = config.battery_capacity_kwh * (100 - config.battery_reserve_percent) / 100
-    lines.append(f"{GRAY}Battery: {config.battery_capacity_kwh:.1f} kWh total · {usable_capacity:.1f} kWh usable · {config.battery_reserve_percent}% reserve{RESET}")
+    lines.append(f"{_GRAY}Battery: {config.battery_capacity_kwh:.1f} kWh total · {usable_capacity:.1f} kWh usable · {config.battery_reserve_percent}% reserve{_RESET}")
 
     return "\n".join(lines)
 
@@ -957,12 +955,6 @@ def configure_logging(verbosity: int) -> None:
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
 
 
-def clear_screen() -> None:
-    """Clear the terminal screen."""
-    # Use ANSI escape codes for better compatibility
-    print("\033[2J\033[H", end="")
-
-
 def main(argv: List[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
     configure_logging(args.verbose)
@@ -980,18 +972,23 @@ def main(argv: List[str] | None = None) -> int:
             return 1
 
         error_count = 0
+        footer = (
+            f"{_GRAY}Made by Jordy Meow (https://jordymeow.com){_RESET}\n"
+            f"{_GRAY}⟳ Refreshing every {args.interval}s · Press Ctrl+C to stop{_RESET}\n"
+        )
         try:
+            # Tick on an absolute monotonic schedule so fetch latency does not
+            # silently stretch the effective interval.
+            next_tick = time.monotonic()
             while True:
-                clear_screen()
+                next_tick += args.interval
                 try:
                     data = client.get_status()
 
                     # Log data to CSV if at 10-minute interval
                     logger.log(data)
 
-                    print(render_status(data, config), flush=True)
-                    print(f"\033[90mMade by Jordy Meow (https://jordymeow.com)\033[0m", flush=True)
-                    print(f"\033[90m⟳ Refreshing every {args.interval}s · Press Ctrl+C to stop\033[0m", flush=True)
+                    frame = f"{render_status(data, config)}\n{footer}"
                     error_count = 0  # Reset error count on success
                 except KyoceraError as exc:
                     error_count += 1
@@ -1002,11 +999,24 @@ def main(argv: List[str] | None = None) -> int:
                     elif "Network error" in error_msg:
                         error_msg = "Network connection failed"
 
-                    print(f"\n\033[1m\033[96m⚡ Kyocera Solar\033[0m\033[90m · Connection issue\033[0m\n", flush=True)
-                    print(f"\033[91m✗ {error_msg}\033[0m", flush=True)
-                    print(f"\033[90m⟳ Retrying in {args.interval}s (attempt {error_count}) · Press Ctrl+C to stop\033[0m", flush=True)
+                    frame = (
+                        f"\n{_BOLD}{_CYAN}⚡ Kyocera Solar{_RESET}{_GRAY} · Connection issue{_RESET}\n\n"
+                        f"{_RED}✗ {error_msg}{_RESET}\n"
+                        f"{_GRAY}⟳ Retrying in {args.interval}s (attempt {error_count}) · Press Ctrl+C to stop{_RESET}\n"
+                    )
 
-                time.sleep(args.interval)
+                # Clear + frame in a single write so slow terminals never show
+                # a partially drawn refresh.
+                sys.stdout.write(f"\033[2J\033[H{frame}")
+                sys.stdout.flush()
+
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                else:
+                    # We fell behind (slow fetch); re-sync instead of firing
+                    # back-to-back requests to catch up.
+                    next_tick = time.monotonic()
         except KeyboardInterrupt:
             print("\n\033[90mStopped.\033[0m")
             return 0
@@ -1022,8 +1032,13 @@ def main(argv: List[str] | None = None) -> int:
         logger.log(data)
 
         if args.json:
-            json.dump(data, sys.stdout, indent=2)
-            sys.stdout.write("\n")
+            if orjson is not None:
+                # One bytes write instead of many small encoded text writes.
+                sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                sys.stdout.buffer.write(b"\n")
+            else:
+                json.dump(data, sys.stdout, indent=2)
+                sys.stdout.write("\n")
         else:
             print(render_status(data, config))
     return 0